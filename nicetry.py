@@ -1,10 +1,9 @@
-from abc import abstractmethod, ABC
-from typing import Callable, Generic, TypeVar, Union
+from typing import Callable, Generic, Iterable, Iterator, List, TypeVar, Union, final
 
 T = TypeVar('T')
 U = TypeVar('U')
 
-class Try(ABC, Generic[T]):
+class Try(Generic[T]):
     """
     The `Try` type represents a computation that may fail during evaluation by raising an exception.
     It holds either a successfully computed value or the exception that was thrown. This approach
@@ -69,11 +68,25 @@ class Try(ABC, Generic[T]):
     >>>
     >>> divide()
 
+    When the failure of a computation can be predicted from its result, `Try.check` avoids raising and catching
+    an exception on the failure path, which is considerably faster for failure-heavy workloads.
+
+    >>> from nicetry import Try, Success, Failure
+    >>>
+    >>> def domain(email):
+    >>>   at = Try.check(lambda: email.find("@"), lambda i: i >= 0, lambda i: ValueError(f"Invalid e-mail: {email}"))
+    >>>   return at.map(lambda i: email[i + 1:])
+
     :copyright: (c) 2023-2024 by Luiz Ricardo Belem.
     :license: MIT, see LICENSE for more details.
     """
     __slots__ = ("_value",)
 
+    # `True` if the `Try` is a `Success`, `False` otherwise.
+    is_success: bool
+    # `True` if the `Try` is a `Failure`, `False` otherwise.
+    is_failure: bool
+
     @staticmethod
     def to(f: Callable[[], T]) -> "Try[T]":
         """Factory method of a Try object.
@@ -83,37 +96,71 @@ class Try(ABC, Generic[T]):
         :return: the result of evaluating the callable, wrapped as a `Success` or `Failure`.
         """
         try:
-            return Success(f())
+            return _mk_success(f())
         except Exception as e:
-            return Failure(e)
+            return _mk_failure(e)
+
+    # Factory method of a Try object, same as Try.to(<Callable>) method.
+    # This alias only exists to conform to Scala Try API.
+    apply = to
 
     @staticmethod
-    def apply(f: Callable[[], T]) -> "Try[T]":
-        """Factory method of a Try object, same as Try.to(<Callable>) method.
+    def check(f: Callable[[], T], is_ok: Callable[[T], bool], make_err: Callable[[T], Exception]) -> "Try[T]":
+        """Factory method of a Try object for computations whose failure can be told from the result itself.
+
+        Unlike `Try.to`, the expected failure mode does not need to raise an exception, which is much cheaper
+        when failures are frequent. Exceptions raised by `f`, `is_ok` or `make_err` are still wrapped in a `Failure`.
+
+        :param f: callable to be computed. The callable must be a lambda function with no param.
+        :param is_ok: predicate that tells whether the computed value is a success.
+        :param make_err: builds the exception to be wrapped in a `Failure` from a value rejected by `is_ok`.
 
-        This method only exists to conform to Scala Try API.
+        :return: the computed value wrapped as a `Success` if it satisfies `is_ok`, a `Failure` otherwise.
         """
-        return Try.to(f)
+        try:
+            v = f()
+            return _mk_success(v) if is_ok(v) else _mk_failure(make_err(v))
+        except Exception as e:
+            return _mk_failure(e)
 
-    def __init__(self, value: T) -> None:
-        super().__init__()
-        self._value = value
+    @staticmethod
+    def sequence(tries: Iterable["Try[T]"]) -> "Try[List[T]]":
+        """Turns an iterable of `Try` into a `Try` of a list, stopping at the first `Failure`.
 
-    @property
-    def is_failure(self) -> bool:
-        """Returns `True` if the `Try` is a `Failure`, `False` otherwise.
+        :param tries: the `Try` instances to be combined.
 
-        :return: `True` if the `Try` is a `Failure`, `False` otherwise.
+        :return: the values from all the `Success` instances wrapped in a `Success`, or the first `Failure`.
         """
-        return isinstance(self, Failure)
+        values = []
+        for t in tries:
+            if t.__class__ is Failure:
+                return t
+            values.append(t._value)
+        return _mk_success(values)
 
-    @property
-    def is_success(self) -> bool:
-        """Returns `True` if the `Try` is a `Success`, `False` otherwise.
+    @staticmethod
+    def traverse(items: Iterable[T], f: Callable[[T], "Try[U]"]) -> "Try[List[U]]":
+        """Applies the given function to every item and combines the outcomes as `Try.sequence` does,
+        stopping at the first `Failure` without applying the function to the remaining items.
+
+        :param items: the items to be passed to the function.
+        :param f: lambda function to be applied. The lambda function must return a `Try`.
 
-        :return: `True` if the `Try` is a `Success`, `False` otherwise.
+        :return: the values from all the outcomes wrapped in a `Success`, or the first `Failure`.
         """
-        return isinstance(self, Success)
+        values = []
+        for item in items:
+            try:
+                t = f(item)
+            except Exception as e:
+                return _mk_failure(e)
+            if t.__class__ is Failure:
+                return t
+            values.append(t._value)
+        return _mk_success(values)
+
+    def __init__(self, value: T) -> None:
+        self._value = value
 
     @property
     def value(self) -> T:
@@ -123,7 +170,6 @@ class Try(ABC, Generic[T]):
         """
         return self._value
 
-    @abstractmethod
     def get(self) -> T:
         """Returns the value from this `Success` or throws the exception if this is a `Failure`.
 
@@ -137,7 +183,7 @@ class Try(ABC, Generic[T]):
 
         :return:
         """
-        return Success(self._value) if self.is_failure else Failure(UnsupportedOperationException("Success.failed"))
+        raise NotImplementedError
 
     def get_or_else(self, default_value: T) -> T:
         """Returns the value from this `Success` or the given `default_value` argument if this is a `Failure`.
@@ -148,13 +194,17 @@ class Try(ABC, Generic[T]):
 
         :return: the value from this `Success` or the given `default_value` argument if this is a `Failure`.
         """
-        return default_value if self.is_failure else self.get()
+        raise NotImplementedError
 
     def flat_map(self, f: Callable[[T], "Try[U]"]) -> "Try[U]":
-        try:
-            return f(self.get())
-        except Exception as e:
-            return Failure(e)
+        """Returns the given function applied to the value from this `Success` or returns this if this is a `Failure`.
+
+        :param f: lambda function to be applied. The lambda function parameter is the value from this Success
+            and it must return a `Try`.
+
+        :return: the `Try` returned by the function or this if this is a `Failure`.
+        """
+        raise NotImplementedError
 
     def map(self, f: Callable[[T], U]) -> "Try[U]":
         """Maps the given function to the value from this `Success` or returns this if this is a `Failure`.
@@ -164,14 +214,13 @@ class Try(ABC, Generic[T]):
         :return: the outcome of the mapped function to the value from this `Success` or this if this is a `Failure`.
 
         """
-        return Try.to(lambda: f(self.get())) if self.is_success else self
+        raise NotImplementedError
 
     def or_else(self, t: "Try[U]") -> "Try[U]":
         """Returns this `Try` if it's a `Success` or the given `default` argument if this is a `Failure`.
         """
-        return self if self.is_success else t
+        raise NotImplementedError
 
-    @abstractmethod    
     def for_each(self, f: Callable[[T], None]) -> None:
         """
         Applies the given function f if this is a Success, otherwise does nothing if this is a Failure.
@@ -180,56 +229,100 @@ class Try(ABC, Generic[T]):
         """
         raise NotImplementedError
 
-    def __iter__(self) -> "Try[T]":
-        return self
+    def __eq__(self, other: object) -> bool:
+        if self.__class__ is not other.__class__:
+            return False if isinstance(other, Try) else NotImplemented
+        return self._value == other._value
 
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._value))
 
+
+@final
 class Success(Try[T]):
-    __slots__ = ("_has_next",)
+    __slots__ = ()
     __match_args__ = ("_value",)
 
+    is_success = True
+    is_failure = False
+
     def __init__(self, value: T) -> None:
-        super().__init__(value)
-        self._has_next = True
+        self._value = value
 
     def get(self) -> T:
         return self._value
 
+    def failed(self) -> "Try[Exception]":
+        return _mk_failure(UnsupportedOperationException("Success.failed"))
+
+    def get_or_else(self, default_value: T) -> T:
+        return self._value
+
+    def flat_map(self, f: Callable[[T], "Try[U]"]) -> "Try[U]":
+        try:
+            return f(self._value)
+        except Exception as e:
+            return _mk_failure(e)
+
+    def map(self, f: Callable[[T], U]) -> "Try[U]":
+        try:
+            return _mk_success(f(self._value))
+        except Exception as e:
+            return _mk_failure(e)
+
+    def or_else(self, t: "Try[U]") -> "Try[U]":
+        return self
+
     def for_each(self, f: Callable[[T], None]) -> None:
-        return f(self.get())
+        return f(self._value)
 
-    def __next__(self) -> T:
-        if self._has_next:
-            self._has_next = False
-            return self._value
-        self._has_next = True
-        raise StopIteration
+    def __iter__(self) -> Iterator[T]:
+        return iter((self._value,))
 
     def __repr__(self) -> str:
-        return "Success({})".format(str(self._value))
+        return f"Success({self._value!r})"
 
     def __str__(self) -> str:
         return str(self._value)
 
 
+@final
 class Failure(Try[Exception]):
     __slots__ = ()
     __match_args__ = ("_value",)
 
+    is_success = False
+    is_failure = True
+
     def __init__(self, exception: Exception) -> None:
-        super().__init__(exception)
+        self._value = exception
 
     def get(self) -> Exception:
         raise self._value
 
+    def failed(self) -> "Try[Exception]":
+        return _mk_success(self._value)
+
+    def get_or_else(self, default_value: T) -> T:
+        return default_value
+
+    def flat_map(self, f: Callable[[T], "Try[U]"]) -> "Try[U]":
+        return self
+
+    def map(self, f: Callable[[T], U]) -> "Try[U]":
+        return self
+
+    def or_else(self, t: "Try[U]") -> "Try[U]":
+        return t
+
     def for_each(self, f: Callable[[T], None]) -> None:
         pass
 
-    def __next__(self) -> Exception:
-        raise StopIteration
+    def __iter__(self) -> Iterator[T]:
+        return _EMPTY_ITER
 
     def __repr__(self) -> str:
-        return "Failure({})".format(str(self._value))
+        return f"Failure({self._value!r})"
 
     def __str__(self) -> str:
         return str(self._value)
@@ -237,3 +330,20 @@ class Failure(Try[Exception]):
 
 class UnsupportedOperationException(Exception):
     pass
+
+
+# Constructors used internally: they set the slot directly and skip the `__init__` call.
+def _mk_success(value: T, _new=object.__new__, _cls=Success) -> "Success[T]":
+    s = _new(_cls)
+    s._value = value
+    return s
+
+
+def _mk_failure(exception: Exception, _new=object.__new__, _cls=Failure) -> "Failure":
+    f = _new(_cls)
+    f._value = exception
+    return f
+
+
+# An empty iterator is always exhausted, so every `Failure` can share the same one.
+_EMPTY_ITER = iter(())
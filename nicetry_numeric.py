@@ -0,0 +1,133 @@
+import numpy as np
+from numba import njit
+from typing import Callable, Optional, Tuple
+
+from nicetry import Failure, Success, Try
+
+
+class TryArray:
+    """
+    A batch of `float64` computations that may fail, stored as two parallel arrays instead of one
+    `Try` instance per value: `tags[i]` is `True` if the i-th element is a success and `values[i]`
+    holds its value. Failed elements hold `NaN`.
+
+    `TryArray` is meant for numeric pipelines where the per-value overhead of `Try` objects dominates
+    the arithmetic. Failures are not raised: an element becomes a failure when the mapped function
+    raises an exception or returns a non-finite value.
+
+    Example:
+    >>> import numpy as np
+    >>> from numba import njit
+    >>> from nicetry_numeric import TryArray, map_f64
+    >>>
+    >>> @njit
+    >>> def inverse(x):
+    >>>     return 1.0 / x
+    >>>
+    >>> result = map_f64(TryArray.from_values(np.array([2.0, 0.0, 4.0])), inverse)
+    >>> result.tags
+    array([ True, False,  True])
+    >>> result.values
+    array([0.5 ,  nan, 0.25])
+
+    :copyright: (c) 2023-2024 by Luiz Ricardo Belem.
+    :license: MIT, see LICENSE for more details.
+    """
+    __slots__ = ("tags", "values")
+
+    @staticmethod
+    def from_values(values: np.ndarray) -> "TryArray":
+        """Factory method of a TryArray object where every non-finite value is a failure.
+
+        :param values: the values to be wrapped.
+
+        :return: a `TryArray` holding the given values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        tags = np.isfinite(values)
+        return TryArray(tags, np.where(tags, values, np.nan))
+
+    def __init__(self, tags: np.ndarray, values: np.ndarray) -> None:
+        self.tags = tags
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"TryArray(tags={self.tags!r}, values={self.values!r})"
+
+
+# Serial on purpose: an exception raised by `fn` inside a `prange` loop is not propagated correctly,
+# and Numba cannot parallelize a loop containing try/except.
+@njit
+def _map_f64(fn, tags, values):
+    n = values.shape[0]
+    out_tags = np.empty(n, dtype=np.bool_)
+    out_values = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        if tags[i]:
+            try:
+                v = fn(values[i])
+            except Exception:
+                out_tags[i] = False
+                out_values[i] = np.nan
+                continue
+            ok = np.isfinite(v)
+            out_tags[i] = ok
+            out_values[i] = v if ok else np.nan
+        else:
+            out_tags[i] = False
+            out_values[i] = np.nan
+    return out_tags, out_values
+
+
+def map_f64(t: TryArray, fn: Callable[[float], float]) -> TryArray:
+    """Maps the given function to every successful value of the `TryArray`.
+
+    Elements for which the function raises an exception or returns a non-finite value become failures;
+    failed elements are passed on unchanged.
+
+    :param t: the `TryArray` to be mapped.
+    :param fn: a Numba-compiled function taking and returning a float.
+
+    :return: a new `TryArray` with the outcome of the mapped function.
+    """
+    return TryArray(*_map_f64(fn, t.tags, t.values))
+
+
+@njit
+def try_call_f64(fn: Callable[[float], float], x: float) -> Tuple[bool, float]:
+    """Calls the given Numba-compiled function and returns a `(tag, value)` tuple instead of a `Try`,
+    so that it can be used inside other Numba-compiled code in nopython mode.
+
+    The tag is `False` if the function raises an exception or returns a non-finite value, in which case
+    the value is `NaN`. Numba only catches exceptions raised by compiled code and cannot tell them apart,
+    so prefer functions compiled with `error_model="numpy"` that signal failures by non-finite results.
+
+    :param fn: a Numba-compiled function taking and returning a float.
+    :param x: the argument to be passed to the function.
+
+    :return: `(True, fn(x))` on success, `(False, NaN)` otherwise.
+    """
+    try:
+        v = fn(x)
+    except Exception:
+        return False, np.nan
+    if np.isfinite(v):
+        return True, v
+    return False, np.nan
+
+
+def from_tagged(tag: bool, value: float, exception: Optional[Exception] = None) -> Try[float]:
+    """Converts a `(tag, value)` pair, such as the ones from `try_call_f64` or `TryArray`, into a `Try`.
+
+    :param tag: `True` if the value is a success.
+    :param value: the value to be wrapped if this is a success.
+    :param exception: the exception to be wrapped if this is a failure. Defaults to an `ArithmeticError`.
+
+    :return: the value wrapped in a `Success` or the exception wrapped in a `Failure`.
+    """
+    if tag:
+        return Success(float(value))
+    return Failure(exception if exception is not None else ArithmeticError("numeric computation failed"))